@@ -9,17 +9,45 @@ keyword frequency per author in real time (stacked bar chart).
 # Imports
 #####################################
 
+import bisect
 import json
 import os
 import sys
 import time
 import pathlib
-from collections import defaultdict
+import threading
+import zipfile
 import numpy as np
 
+# Prefer orjson's C parser; otherwise decode with one shared stdlib decoder
+try:
+    from orjson import loads as json_loads, JSONDecodeError
+except ImportError:
+    from json import JSONDecodeError
+
+    JSON_DECODER = json.JSONDecoder()
+
+    def json_loads(message: bytes | str):
+        """Parse one JSON document via raw_decode, skipping json.loads' wrapper."""
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", "replace")
+        message = message.strip()
+        obj, end = JSON_DECODER.raw_decode(message)
+        if end != len(message):
+            raise JSONDecodeError("Extra data", message, end)
+        return obj
+
+# Import watchdog only if available (event-driven tailing; otherwise we poll)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 import matplotlib.pyplot as plt
+from matplotlib.container import BarContainer
 from matplotlib.patches import Patch
-from matplotlib.colors import ListedColormap
 from utils.utils_logger import logger
 
 
@@ -28,32 +56,109 @@ from utils.utils_logger import logger
 #####################################
 
 # Speed settings
-VISUAL_PAUSE_SECS = 0.0  # pause after each processed message
-IDLE_POLL_SECS = 0.0     # wait this long when no new messages
+IDLE_POLL_SECS = 1 / 30  # wait this long between drains when polling (no watchdog)
+WATCH_TIMEOUT_SECS = 0.1  # with watchdog: longest wait before servicing GUI events
+TARGET_FPS = 20           # redraw at most this often, however fast messages arrive
+MIN_FRAME_SECS = 1.0 / TARGET_FPS
+
+# Bytes requested per os.read() call while tailing
+READ_CHUNK_BYTES = 1 << 16
+
+# Per-message diagnostic prints (off by default; they dominate at high message rates)
+DEBUG = False
 
 PROJECT_ROOT = pathlib.Path(__file__).parent.parent
 DATA_FOLDER = PROJECT_ROOT.joinpath("data")
 DATA_FILE = DATA_FOLDER.joinpath("project_live.json")
 
+# Counts snapshot (resume after a restart without re-reading the stream)
+SNAPSHOT_FILE = DATA_FOLDER.joinpath("project_consumer_snapshot.npz")
+SNAPSHOT_EVERY = 1000  # lines consumed between snapshots
+SNAPSHOT_HEAD_BYTES = 256    # leading bytes of the data file kept to recognize it
+RESUME_FROM_SNAPSHOT = True  # False: ignore any snapshot and start at the end of the file
+
 logger.info(f"Project root: {PROJECT_ROOT}")
 logger.info(f"Data folder: {DATA_FOLDER}")
 logger.info(f"Data file: {DATA_FILE}")
 
 
 #####################################
-# Data: author -> { keyword -> count }
+# Data: counts_mat[keyword row, author column]
 #####################################
 
-keyword_counts_by_author = defaultdict(lambda: defaultdict(int))
+author_idx: dict[str, int] = {}  # author -> column, in first-seen order
+kw_idx: dict[str, int] = {}      # keyword -> row, in first-seen order
+cell_idx: dict[tuple[str, str], tuple[int, int]] = {}  # (author, keyword) -> (row, col)
+counts_mat = np.zeros((4, 4), dtype=np.int32)
+
+
+def index_for(key: str, index: dict[str, int], axis: int) -> int:
+    """Return key's row/column, growing counts_mat 2x along axis when full."""
+    global counts_mat
+    i = index.get(key)
+    if i is None:
+        i = index[key] = len(index)
+        size = counts_mat.shape[axis]
+        if i >= size:
+            pad = [(0, 0), (0, 0)]
+            pad[axis] = (0, size)
+            counts_mat = np.pad(counts_mat, pad)
+    return i
+
+
+# Chart order, maintained incrementally as new names arrive
+AUTHORS: list[str] = []   # sorted
+KEYWORDS: list[str] = []  # first-seen (palette) order, "(none)" last
+STRUCTURE_DIRTY = False   # AUTHORS/KEYWORDS changed since the last relayout
+PENDING_AUTHORS: set[str] = set()  # authors whose counts changed since the last frame
+
+# Guards all of the above (plus the color maps): the reader thread writes,
+# the GUI thread snapshots under the lock and draws without it.
+COUNTS_LOCK = threading.Lock()
+
+
+def track_author(author: str) -> None:
+    """Slot a brand-new author into chart order and flag a relayout."""
+    global STRUCTURE_DIRTY
+    if author not in author_idx:
+        bisect.insort(AUTHORS, author)
+        STRUCTURE_DIRTY = True
+
+
+def track_keyword(keyword: str) -> None:
+    """Slot a brand-new keyword into chart order and flag a relayout."""
+    global STRUCTURE_DIRTY
+    if keyword not in kw_idx:
+        if KEYWORDS and KEYWORDS[-1] == "(none)":
+            KEYWORDS.insert(len(KEYWORDS) - 1, keyword)
+        else:
+            KEYWORDS.append(keyword)
+        STRUCTURE_DIRTY = True
 
 
 #####################################
 # Live Plot (stacked bars: authors x, stacks = keywords)
 #####################################
 
+# Prefer Qt's Agg canvas (fast blitting); keep matplotlib's default if Qt or a
+# display is unavailable, or if a backend was chosen via MPLBACKEND
+if "MPLBACKEND" not in os.environ:
+    try:
+        plt.switch_backend("QtAgg")
+    except ImportError:
+        pass
+
 plt.ion()
 fig, ax = plt.subplots()
 
+# Right-hand share of the figure kept for the keyword legend
+LEGEND_WIDTH_FRAC = 0.25
+
+# Static text is set once; ax.clear() is never called, so it persists
+ax.set_xlabel("Authors")
+ax.set_ylabel("Keyword Counts")
+ax.set_title("Real-Time Keyword Frequency per Author (Stacked)")
+
 # --- Distinct warm palette (teal/indigo/magenta/coral/amber) ---
 PALETTE = [
     "#134E6F",    # deep teal
@@ -68,133 +173,470 @@ PALETTE = [
 ]
 
 # Color assignment + stable palette order tracking
-keyword_color: dict[str, str] = {}  # kw -> hex color
 assign_rank: dict[str, int] = {}    # kw -> 0,1,2... in palette order
+COLOR_BY_RANK: list[str] = []       # rank -> hex color
 
 
 def color_for(kw: str):
     """Assign a color the first time we see kw, recording its palette order."""
-    if kw not in keyword_color:
-        idx = len(keyword_color)  # 0,1,2...
-        keyword_color[kw] = PALETTE[idx % len(PALETTE)]
-        assign_rank[kw] = len(assign_rank)
-    return keyword_color[kw]
+    r = assign_rank.get(kw)
+    if r is None:
+        r = assign_rank[kw] = len(COLOR_BY_RANK)  # 0,1,2...
+        COLOR_BY_RANK.append(PALETTE[r % len(PALETTE)])
+    return COLOR_BY_RANK[r]
 
 
 # Legend order control (False = bottom→top, True = top→bottom)
 LEGEND_TOP_FIRST = True
 
 
-def update_chart_all():
-    ax.clear()
+# Blitting state: bars are built once per chart structure (authors x keywords)
+# and only their heights/offsets change on normal updates. GUI thread only.
+BARS: BarContainer | None = None     # keyword-major: bar for (kw k, author i) is BARS[k * A + i]
+BAR_ROWS = np.zeros(0, dtype=np.intp)  # counts_mat rows in stack order
+BAR_COLS = np.zeros(0, dtype=np.intp)  # counts_mat columns in x order
+BG = None                            # cached axes background (everything but the bars)
 
-    authors = sorted(keyword_counts_by_author.keys())
-    if not authors:
-        plt.draw()
-        plt.pause(0.01)
-        return
+# Chart structure the bars were built for (snapshotted from AUTHORS/KEYWORDS)
+CHART_AUTHORS: list[str] = []
+CHART_KEYWORDS: list[str] = []
+CHART_COLORS: list[str] = []
+CHART_POS: dict[str, int] = {}       # author -> x position
+
+# Keywords the current legend was built for (rebuilt only when this changes)
+LAST_LEGEND_KEYS: tuple | None = None
+
+# Extra room above the tallest stack so most updates stay on the fast path
+YLIM_HEADROOM = 1.2
 
-    # union of all keywords across authors
-    all_keywords = set()
-    for a in authors:
-        all_keywords.update(keyword_counts_by_author[a].keys())
-
-    # ensure any brand-new keywords get assigned a color/rank now
-    for kw in all_keywords:
-        _ = color_for(kw)
-
-    # order keywords by first-assigned palette order; put "(none)" last
-    keywords = [k for k in all_keywords if k != "(none)"]
-    keywords.sort(key=lambda k: (assign_rank.get(k, 10**9), k))
-    if "(none)" in all_keywords:
-        keywords.append("(none)")
-
-    x = list(range(len(authors)))
-    bottoms = [0] * len(authors)
-
-    for kw in keywords:
-        heights = [keyword_counts_by_author[a].get(kw, 0) for a in authors]
-        ax.bar(
-            x,
-            heights,
-            bottom=bottoms,
-            label=kw,
-            color=color_for(kw),
-            edgecolor="white",
-            linewidth=0.6,
-        )
-        # update bottoms element-wise
-        bottoms = [b + h for b, h in zip(bottoms, heights)]
 
-    ax.set_xlabel("Authors")
-    ax.set_ylabel("Keyword Counts")
-    ax.set_title("Real-Time Keyword Frequency per Author (Stacked)")
+def snapshot_counts() -> tuple[np.ndarray, set[str], bool] | None:
+    """
+    Under COUNTS_LOCK, copy what the next frame needs.
+    Returns (chart-ordered heights, changed authors, relayout?) or None if empty.
+    """
+    global STRUCTURE_DIRTY, BAR_ROWS, BAR_COLS
+    global CHART_AUTHORS, CHART_KEYWORDS, CHART_COLORS, CHART_POS
+
+    with COUNTS_LOCK:
+        if not AUTHORS:
+            return None
+
+        changed = PENDING_AUTHORS.copy()
+        PENDING_AUTHORS.clear()
+
+        relayout = BG is None or STRUCTURE_DIRTY
+        if relayout:
+            STRUCTURE_DIRTY = False
+            CHART_AUTHORS = list(AUTHORS)
+            CHART_KEYWORDS = list(KEYWORDS)
+            CHART_COLORS = [COLOR_BY_RANK[assign_rank[kw]] for kw in KEYWORDS]
+            CHART_POS = {a: i for i, a in enumerate(AUTHORS)}
+            BAR_ROWS = np.array([kw_idx[kw] for kw in KEYWORDS], dtype=np.intp)
+            BAR_COLS = np.array([author_idx[a] for a in AUTHORS], dtype=np.intp)
+
+        # fancy indexing copies, so drawing can happen without the lock
+        heights = counts_mat[np.ix_(BAR_ROWS, BAR_COLS)]
+
+    return heights, changed, relayout
+
+
+def rebuild_chart(heights: np.ndarray) -> None:
+    """Slow path: recreate the bars for a new chart structure, then relayout."""
+    global BARS
+
+    # swap out the old bars only; legend and labels stay on the axes
+    if BARS is not None:
+        BARS.remove()
+
+    # stacks via one cumulative sum over the chart-ordered counts
+    tops = np.cumsum(heights, axis=0)
+    bottoms = tops - heights
+
+    # every stack segment in one bar() call (flattened keyword-major)
+    x = np.arange(len(CHART_AUTHORS))
+    BARS = ax.bar(
+        np.tile(x, len(CHART_KEYWORDS)),
+        heights.ravel(),
+        bottom=bottoms.ravel(),
+        color=np.repeat(CHART_COLORS, len(CHART_AUTHORS)),
+        edgecolor="white",
+        linewidth=0.6,
+        animated=True,  # drawn by blit_bars(), not baked into the background
+    )
+
+    ax.set_ylim(0, max(tops[-1].max() * YLIM_HEADROOM, 1))
+    init_axes(x)
+    recapture_background()
+
+
+def init_axes(x: np.ndarray) -> None:
+    """Per-structure layout: author ticks, legend, and one tight_layout() pass."""
     ax.set_xticks(x)
-    ax.set_xticklabels(authors, rotation=45, ha="right")
+    ax.set_xticklabels(CHART_AUTHORS, rotation=45, ha="right")
+    update_legend(CHART_KEYWORDS, CHART_COLORS)
+
+    # fit axes + rotated ticks to the left of the legend's reserved strip
+    fig.tight_layout(rect=(0, 0, 1 - LEGEND_WIDTH_FRAC, 1))
+
+
+def recapture_background() -> None:
+    """Full draw of everything but the bars; on_draw() caches it and adds the bars."""
+    fig.canvas.draw()
+    fig.canvas.flush_events()
+
+
+def on_draw(event) -> None:
+    """
+    After any full canvas draw (ours, a resize, an expose), re-cache the
+    blit background and paint the animated bars, which the draw skipped.
+    """
+    global BG
+    if BARS is None or fig.canvas.is_saving():
+        return  # savefig() already includes animated artists
+    BG = fig.canvas.copy_from_bbox(ax.bbox)
+    for rect in BARS:
+        ax.draw_artist(rect)
+
+
+DRAW_CID = fig.canvas.mpl_connect("draw_event", on_draw)
+
+
+def freeze_chart() -> None:
+    """Hand the bars back to normal drawing, for the final plt.show()."""
+    fig.canvas.mpl_disconnect(DRAW_CID)
+    if BARS is not None:
+        for rect in BARS:
+            rect.set_animated(False)
+
+
+def update_legend(keywords: list[str], colors: list[str]) -> None:
+    """(Re)build the legend, but only when the keyword set/order changed."""
+    global LAST_LEGEND_KEYS
+    key = tuple(keywords)
+    if key == LAST_LEGEND_KEYS:
+        return
 
     # Legend that matches the stack order (same as keywords order)
-    kw_order = keywords if not LEGEND_TOP_FIRST else list(reversed(keywords))
-    handles = [Patch(facecolor=color_for(kw), edgecolor="black", label=kw) for kw in kw_order]
-    ax.legend(
+    pairs = list(zip(keywords, colors))
+    if LEGEND_TOP_FIRST:
+        pairs.reverse()
+    handles = [Patch(facecolor=color, edgecolor="black", label=kw) for kw, color in pairs]
+    legend = ax.legend(
         handles=handles,
         title="Keywords",
         loc="upper left",
         bbox_to_anchor=(1.02, 1),
         borderaxespad=0,
     )
+    legend.set_in_layout(False)  # lives in the strip tight_layout() leaves free
+    LAST_LEGEND_KEYS = key
+
+
+def restack_column(i: int, heights: np.ndarray, tops: np.ndarray) -> None:
+    """Update the bars of the author at x position i in place."""
+    for rect, h, top in zip(BARS[i::len(CHART_AUTHORS)], heights[:, i], tops[:, i]):
+        rect.set_y(top - h)
+        rect.set_height(h)
+
+
+def blit_bars() -> None:
+    """Fast path: paint the bars over the cached background."""
+    fig.canvas.restore_region(BG)
+    for rect in BARS:
+        ax.draw_artist(rect)
+    fig.canvas.blit(ax.bbox)
+    fig.canvas.flush_events()
+
+
+def update_heights(heights: np.ndarray, changed: set[str]) -> float:
+    """Restack the changed columns in place; return the tallest stack."""
+    tops = np.cumsum(heights, axis=0)
+    cols = [CHART_POS[a] for a in changed] if changed else range(len(CHART_AUTHORS))
+    for i in cols:
+        restack_column(i, heights, tops)
+    return tops[-1].max()
 
-    plt.tight_layout()
-    plt.draw()
-    plt.pause(0.01)
+
+def update_chart_all() -> None:
+    """
+    Refresh the chart with every count change since the last frame.
+
+    Only a new author/keyword triggers a relayout, and a stack outgrowing
+    the y-axis only grows the limit; otherwise the changed columns are
+    restacked and blitted.
+    """
+    snapshot = snapshot_counts()
+    if snapshot is None:
+        return
+    heights, changed, relayout = snapshot
+
+    if relayout:
+        rebuild_chart(heights)
+        return
+
+    tallest = update_heights(heights, changed)
+    if tallest > ax.get_ylim()[1]:
+        ax.set_ylim(0, tallest * YLIM_HEADROOM)
+        recapture_background()
+        return
+
+    blit_bars()
 
 
 #####################################
-# Process one message
+# Process messages
 #####################################
 
-def process_message(message: str) -> None:
+def ingest_message(message: bytes | str) -> str | None:
     """
-    Process a single JSON message and update the chart.
+    Parse one JSON message and fold it into the counts (no redraw).
     Expected fields: 'author', 'keyword_mentioned'
+    Returns the author whose column changed, or None if skipped.
     """
     # 1) RAW
-    print("RAW:", message.strip())
+    if DEBUG:
+        print("RAW:", message.strip())
 
     # 2) Parse
     try:
-        message_dict = json.loads(message)
-    except json.JSONDecodeError:
-        print("BAD JSON, skipping:", message.strip())
-        return
+        message_dict = json_loads(message)
+    except JSONDecodeError:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", "replace")
+        logger.warning(f"BAD JSON, skipping: {message.strip()}")
+        return None
+
+    # valid JSON but not an object (e.g. a list or null): skip it the same way
+    if not isinstance(message_dict, dict):
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", "replace")
+        logger.warning(f"Not a JSON object, skipping: {message.strip()}")
+        return None
+
+    if DEBUG:
+        print("PARSED:", message_dict)
+
+    # 3) Fields (as strings, so odd values can't break hashing or sorting)
+    author = str(message_dict.get("author", "unknown"))
+    keyword = str(message_dict.get("keyword_mentioned") or "(none)")
+    if DEBUG:
+        print(f"FIELDS → author={author}, keyword={keyword}")
+
+    # 4) Update counts (per author): one lookup for a pair we've seen before
+    key = (author, keyword)
+    with COUNTS_LOCK:
+        cell = cell_idx.get(key)
+        if cell is None:
+            # ensure keyword gets a color/rank at first sight
+            _ = color_for(keyword)
+            track_author(author)
+            track_keyword(keyword)
+            # index first: growing rebinds counts_mat
+            cell = cell_idx[key] = (
+                index_for(keyword, kw_idx, axis=0),
+                index_for(author, author_idx, axis=1),
+            )
+        counts_mat[cell] += 1
+        PENDING_AUTHORS.add(author)
+        if DEBUG:
+            col = cell[1]
+            print("COUNTS (this author):", {kw: int(counts_mat[r, col]) for kw, r in kw_idx.items()})
+
+    return author
+
 
-    print("PARSED:", message_dict)
+#####################################
+# Snapshots (resume after restart)
+#####################################
+
+def read_head(fd: int, size: int) -> bytes:
+    """Read the first size bytes of fd without moving its read position."""
+    pos = os.lseek(fd, 0, os.SEEK_CUR)
+    try:
+        os.lseek(fd, 0, os.SEEK_SET)
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.lseek(fd, pos, os.SEEK_SET)
 
-    # 3) Fields
-    author = message_dict.get("author", "unknown")
-    keyword = message_dict.get("keyword_mentioned") or "(none)"
-    print(f"FIELDS → author={author}, keyword={keyword}")
 
-    # ensure keyword gets a color/rank at first sight
-    _ = color_for(keyword)
+def save_snapshot(fd: int, offset: int) -> None:
+    """
+    Write the counts matrix and its row/column labels, plus the data-file
+    offset they cover and the file's identity, to SNAPSHOT_FILE (replaced atomically).
+    """
+    st = os.fstat(fd)
+    head = read_head(fd, min(offset, SNAPSHOT_HEAD_BYTES))
 
-    # 4) Update counts (per author)
-    keyword_counts_by_author[author][keyword] += 1
-    print("COUNTS (this author):", dict(keyword_counts_by_author[author]))
+    with COUNTS_LOCK:
+        counts = counts_mat[: len(kw_idx), : len(author_idx)].copy()
+        authors = list(author_idx)
+        keywords = list(kw_idx)
 
-    # 5) One chart for ALL authors
-    print("Calling update_chart()...")
-    update_chart_all()
-    print("Chart updated.\n")
+    tmp = SNAPSHOT_FILE.with_name(SNAPSHOT_FILE.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                counts=counts,
+                authors=np.array(authors, dtype=str),
+                keywords=np.array(keywords, dtype=str),
+                offset=np.int64(offset),
+                file_id=np.array([st.st_dev, st.st_ino], dtype=np.uint64),
+                head=np.frombuffer(head, dtype=np.uint8),
+            )
+            # on disk before the rename, so a crash can't leave a torn snapshot
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, SNAPSHOT_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write snapshot {SNAPSHOT_FILE}: {e}")
+
+
+def restore_snapshot(fd: int) -> int | None:
+    """
+    Load counts from SNAPSHOT_FILE if it was taken from this same data file
+    (same device/inode and leading bytes, not truncated since).
+    Returns the offset to resume reading from, or None to start at the end.
+    """
+    if not RESUME_FROM_SNAPSHOT or not SNAPSHOT_FILE.exists():
+        return None
 
-    # 6) (optional) throttle
-    if VISUAL_PAUSE_SECS:
-        time.sleep(VISUAL_PAUSE_SECS)
+    try:
+        with np.load(SNAPSHOT_FILE) as snap:
+            counts = snap["counts"]
+            authors = snap["authors"].tolist()
+            keywords = snap["keywords"].tolist()
+            offset = int(snap["offset"])
+            file_id = snap["file_id"].tolist()
+            head = snap["head"].tobytes()
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+        logger.warning(f"Ignoring unreadable snapshot {SNAPSHOT_FILE}: {e}")
+        return None
+
+    st = os.fstat(fd)
+    if (
+        counts.shape != (len(keywords), len(authors))
+        or file_id != [st.st_dev, st.st_ino]
+        or offset > st.st_size
+        or read_head(fd, len(head)) != head
+    ):
+        logger.warning(
+            f"Snapshot {SNAPSHOT_FILE} was taken from a different {DATA_FILE.name} "
+            f"(recreated or truncated?); ignoring it and starting at the end of the file."
+        )
+        return None
+
+    with COUNTS_LOCK:
+        # rows/columns come back in first-seen order, so colors match the last run
+        for kw in keywords:
+            _ = color_for(kw)
+            track_keyword(kw)
+            index_for(kw, kw_idx, axis=0)
+        for a in authors:
+            track_author(a)
+            index_for(a, author_idx, axis=1)
+        counts_mat[: len(keywords), : len(authors)] = counts
+
+    return offset
 
 
 #####################################
 # Main loop (tail a file)
 #####################################
 
+def read_new_lines(fd: int, tail: bytes) -> tuple[list[bytes], bytes]:
+    """
+    Read everything appended since the last call.
+    Returns the complete lines plus the trailing partial line to carry over.
+    """
+    chunks = [tail]
+    while True:
+        chunk = os.read(fd, READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    lines = b"".join(chunks).split(b"\n")
+    tail = lines.pop()  # unterminated line: the producer is mid-write
+    return lines, tail
+
+
+def start_file_watcher(file_changed: threading.Event):
+    """
+    Start a watchdog observer that sets file_changed whenever DATA_FILE is written.
+    Returns the observer, or None if watchdog is not installed.
+    """
+    if not WATCHDOG_AVAILABLE:
+        return None
+
+    class DataFileHandler(FileSystemEventHandler):
+        def on_modified(self, event):
+            if os.path.basename(event.src_path) == DATA_FILE.name:
+                file_changed.set()
+
+        on_created = on_modified
+
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(DataFileHandler(), str(DATA_FILE.parent), recursive=False)
+    observer.start()
+    return observer
+
+
+def tail_file(
+    fd: int,
+    file_changed: threading.Event | None,
+    data_ready: threading.Event,
+    stop: threading.Event,
+) -> None:
+    """
+    Reader thread: ingest new lines as they land and set data_ready so the
+    GUI thread redraws. Waits on file_changed (watchdog) or polls when it is None.
+    """
+    tail = b""
+    offset = os.lseek(fd, 0, os.SEEK_CUR)  # end of the last line fully ingested
+    unsaved = 0  # lines consumed since the last snapshot
+    try:
+        while not stop.is_set():
+            # Drain everything written since the last pass...
+            lines, tail = read_new_lines(fd, tail)
+
+            ingested = False
+            for line in lines:
+                if line.strip() and ingest_message(line) is not None:
+                    ingested = True
+                offset += len(line) + 1  # + the b"\n" split off
+                unsaved += 1
+
+            # ...then ask for one redraw for the whole burst
+            if ingested:
+                data_ready.set()
+
+            if unsaved >= SNAPSHOT_EVERY:
+                save_snapshot(fd, offset)
+                unsaved = 0
+
+            # Sleep until the kernel reports a write (or poll without watchdog)
+            if file_changed is not None:
+                file_changed.wait(WATCH_TIMEOUT_SECS)
+                file_changed.clear()
+            elif IDLE_POLL_SECS:
+                time.sleep(IDLE_POLL_SECS)
+    except Exception as e:
+        logger.error(f"Reader thread error: {e}")
+    finally:
+        if unsaved:
+            save_snapshot(fd, offset)
+
+
 def main() -> None:
     logger.info("START consumer.")
 
@@ -203,25 +645,67 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        with open(DATA_FILE, "r") as file:
-            file.seek(0, os.SEEK_END)
-            print("Consumer is ready and waiting for new JSON messages...")
-
-            while True:
-                line = file.readline()
-
-                if line.strip():
-                    process_message(line)
-                else:
-                    if IDLE_POLL_SECS:
-                        time.sleep(IDLE_POLL_SECS)
-                    continue
+        # Raw fd: one read returns many lines; O_BINARY avoids newline translation on Windows
+        fd = os.open(DATA_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        observer = None  # set below; the finally must not mask an earlier error
+        try:
+            # Resume where the last run's snapshot left off, else start at the end
+            offset = restore_snapshot(fd)
+            if offset is None:
+                os.lseek(fd, 0, os.SEEK_END)
+            else:
+                os.lseek(fd, offset, os.SEEK_SET)
+                logger.info(f"Restored counts from {SNAPSHOT_FILE.name}; resuming at byte {offset}.")
+            logger.info("Consumer is ready and waiting for new JSON messages...")
+
+            file_changed = threading.Event()
+            observer = start_file_watcher(file_changed)
+            if observer is None:
+                logger.info("watchdog not installed; polling for new messages.")
+
+            # Reading/parsing runs on its own thread; the GUI thread only draws
+            data_ready = threading.Event()
+            if offset is not None:
+                data_ready.set()  # show the restored chart right away
+            stop = threading.Event()
+            reader = threading.Thread(
+                target=tail_file,
+                args=(fd, file_changed if observer is not None else None, data_ready, stop),
+                name="tail-reader",
+                daemon=True,
+            )
+            reader.start()
+
+            try:
+                last_draw = 0.0
+                while reader.is_alive():
+                    if not data_ready.wait(WATCH_TIMEOUT_SECS):
+                        fig.canvas.flush_events()  # keep the window responsive while idle
+                        continue
+
+                    # Frame budget: hold new data until MIN_FRAME_SECS since the last
+                    # draw; data_ready stays set, so the final burst is always drawn
+                    wait = last_draw + MIN_FRAME_SECS - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+
+                    data_ready.clear()
+                    update_chart_all()
+                    last_draw = time.monotonic()
+            finally:
+                stop.set()
+                reader.join()
+        finally:
+            if observer is not None:
+                observer.stop()
+            os.close(fd)
 
     except KeyboardInterrupt:
         logger.info("Consumer interrupted by user.")
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
     finally:
+        freeze_chart()
         plt.ioff()
         plt.show()
         logger.info("Consumer closed.")